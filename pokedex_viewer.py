@@ -1,16 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import sys, os, random, json, requests, collections
+import sys, os, random, json, sqlite3, collections
+from array import array
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
-from PyQt6.QtCore import Qt, QTimer, QRunnable, QThreadPool, pyqtSignal, QObject
+try:  # orjson parses/serialises ~10x faster; stdlib json is the fallback
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+from PyQt6.QtCore import Qt, QTimer, QRunnable, QThreadPool, QUrl, QBuffer, QIODevice
 from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PyQt6.QtWidgets import (
     QApplication, QLabel, QWidget, QVBoxLayout,
-    QMenu, QMessageBox, QStackedWidget, QScrollArea, QGridLayout
+    QMenu, QMessageBox, QStackedWidget, QScrollArea
 )
 
 # ───────── CONFIG ─────────
@@ -19,113 +30,259 @@ MAX_ID     = 493
 SHINY_RATE = 1 / 8192
 UK_TZ      = ZoneInfo("Europe/London")
 DEX_COLS   = 5
+DEX_CELL_W, DEX_CELL_H, DEX_SPACING = 60, 72, 6
+_GRID_POS  = [divmod(i, DEX_COLS) for i in range(MAX_ID)]  # pid-1 -> (row, col)
 
 CACHE_DIR  = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "pokesprites"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
-HISTORY_FILE      = CACHE_DIR / "shiny_seen.json"
-ENCOUNTER_LOG     = CACHE_DIR / "encounter_data.json"
+DB_FILE           = CACHE_DIR / "dex.sqlite"
+# Pre-sqlite stores, imported once into an empty database
+LEGACY_SHINY_FILE = CACHE_DIR / "shiny_seen.json"
+LEGACY_ENC_JSON   = CACHE_DIR / "encounter_data.json"
 # ─────────────────────────
 
+# Dex entries for pid <= MAX_ID never change, so each cached JSON file is
+# parsed once per session and boiled down to the few fields a card needs;
+# the full payload (moves, game indices, ...) is not kept around.
+_RECORDS = {}  # cache path -> record built by pokemon_record/species_record
 
-def fetch_json(url: str, cache_path: Path):
-    if cache_path.exists():
-        return json.loads(cache_path.read_text())
-    r = requests.get(url, timeout=10)
-    r.raise_for_status()
-    cache_path.write_text(r.text)
-    return r.json()
+_FLAVOR_TBL = str.maketrans({"\n": " ", "\f": " "})
 
 
-def get_pokemon():
-    pid   = random.randint(1, MAX_ID)
-    shiny = random.random() < SHINY_RATE
+def add_en_flavors(species) -> bool:
+    """Precompute English flavor texts under "_en_flavors"; True if species changed."""
+    if "_en_flavors" in species:
+        return False
+    species["_en_flavors"] = [e["flavor_text"] for e in species["flavor_text_entries"]
+                              if e["language"]["name"] == "en"]
+    return True
 
-    data    = fetch_json(f"{BASE_URL}/pokemon/{pid}",           CACHE_DIR / f"pokemon_{pid}.json")
-    species = fetch_json(f"{BASE_URL}/pokemon-species/{pid}",  CACHE_DIR / f"species_{pid}.json")
 
-    name  = data["name"].capitalize()
-    types = "/".join(t["type"]["name"].capitalize() for t in data["types"])
-    dex   = f"#{pid:03d}"
+def pokemon_record(data):
+    """(record, changed): name, types and sprite URLs from a pokemon payload."""
+    return {
+        "name":  data["name"].capitalize(),
+        "types": "/".join(t["type"]["name"].capitalize() for t in data["types"]),
+        "front_default": data["sprites"]["front_default"],
+        "front_shiny":   data["sprites"]["front_shiny"],
+    }, False
 
-    entries = [e["flavor_text"] for e in species["flavor_text_entries"]
-               if e["language"]["name"] == "en"]
-    flavor  = random.choice(entries).replace("\n", " ").replace("\f", " ").strip() \
-              if entries else "(No flavor text found)"
 
-    sprite_url  = data["sprites"]["front_shiny" if shiny else "front_default"]
-    sprite_tag  = f"{pid}_{'shiny' if shiny else 'normal'}.png"
-    sprite_path = CACHE_DIR / sprite_tag
+def species_record(species):
+    """(record, changed): English flavor texts; changed if the payload gained them."""
+    changed = add_en_flavors(species)
+    return {"en_flavors": species["_en_flavors"]}, changed
+
+
+def sprite_path_for(pid: int, shiny: bool) -> Path:
+    return CACHE_DIR / f"{pid}_{'shiny' if shiny else 'normal'}.png"
+
 
-    if sprite_url and not sprite_path.exists():
-        img = requests.get(sprite_url, timeout=10)
-        if img.ok:
-            sprite_path.write_bytes(img.content)
+def make_card(pid, shiny, pokemon, species):
+    dex     = f"#{pid:03d}"
+    entries = species["en_flavors"]
+    flavor  = random.choice(entries).translate(_FLAVOR_TBL).strip() \
+              if entries else "(No flavor text found)"
 
-    return pid, dex, name, types, flavor, str(sprite_path), shiny
+    return (pid, dex, pokemon["name"], pokemon["types"], flavor,
+            str(sprite_path_for(pid, shiny)), shiny)
 
 
 # ───────── Persistence helpers ─────────
-def load_shiny_history():
-    try:
-        return json.loads(HISTORY_FILE.read_text())
-    except Exception:
-        return []
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS encounters (pid INTEGER, name TEXT, ts TEXT);
+CREATE TABLE IF NOT EXISTS shinies    (pid INTEGER, name TEXT, ts TEXT);
+CREATE INDEX IF NOT EXISTS encounters_pid ON encounters (pid, name);
+"""
+
+
+def shiny_entry(pid, name, when):
+    return {
+        "pid":  pid,
+        "dex":  f"#{pid:03d}",
+        "name": name,
+        "time": when.strftime("%I:%M %p").lstrip("0"),
+        "date": when.strftime("%d/%m/%Y")
+    }
+
+
+def shiny_tip_line(entry):
+    return f"{entry['time']} – {entry['date']}"
+
+
+def _legacy_encounter_rows():
+    if LEGACY_ENC_JSON.exists():
+        raw = json_loads(LEGACY_ENC_JSON.read_bytes())
+        pid_by_name = {v: int(k) for k, v in raw.get("names_by_id", {}).items()}
+        for n in raw.get("names", []):
+            yield pid_by_name.get(n, 0), n, None
+
+
+def _parse_shiny_time(e):
+    """ISO timestamp for an old shiny entry.
+
+    Falls back to 24h time, then to midnight on the day, if the saved AM/PM
+    marker came from another locale; keeping the shiny beats dropping it.
+    """
+    for fmt in ("%I:%M %p %d/%m/%Y", "%H:%M %d/%m/%Y", "%d/%m/%Y"):
+        text = f"{e['time']} {e['date']}" if "%M" in fmt else e["date"]
+        try:
+            return datetime.strptime(text, fmt).replace(tzinfo=UK_TZ).isoformat()
+        except ValueError:
+            continue
+    raise ValueError(f"unparseable shiny time: {e['time']} {e['date']}")
+
 
+def _legacy_shiny_rows():
+    if LEGACY_SHINY_FILE.exists():
+        for e in json_loads(LEGACY_SHINY_FILE.read_bytes()):
+            try:
+                yield int(e["dex"][1:]), e["name"], _parse_shiny_time(e)
+            except Exception:
+                continue  # skip just this entry; the rest still import
 
-def save_shiny_history(hist):
+
+def _import_legacy(con):
+    enc, shinies = [], []
+    for rows, gen in ((enc, _legacy_encounter_rows), (shinies, _legacy_shiny_rows)):
+        try:
+            rows.extend(gen())
+        except Exception:
+            pass  # unreadable file; nothing to import from it
+    save_records(con, enc, shinies)
+
+
+def _connect(path):
+    con = sqlite3.connect(path, isolation_level=None)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(_SCHEMA)
+    return con
+
+
+def open_db():
+    """Return (connection, warning). An unreadable store is moved aside and
+    recreated; if that fails too, an in-memory database is used."""
+    warning = None
+    try:
+        con = _connect(DB_FILE)
+    except sqlite3.DatabaseError:
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        try:
+            for f in (DB_FILE, Path(f"{DB_FILE}-wal"), Path(f"{DB_FILE}-shm")):
+                if f.exists():
+                    os.replace(f, f.with_name(f"{f.name}.bad-{stamp}"))
+            con = _connect(DB_FILE)
+            warning = f"encounter database was unreadable; moved aside as {DB_FILE.name}.bad-{stamp}"
+        except (sqlite3.DatabaseError, OSError):
+            con = _connect(":memory:")
+            warning = "encounter database unavailable; this session won't be saved"
+    if not con.execute("SELECT EXISTS (SELECT 1 FROM encounters) "
+                       "OR EXISTS (SELECT 1 FROM shinies)").fetchone()[0]:
+        _import_legacy(con)
+    return con, warning
+
+
+def load_shiny_history(con):
+    hist = []
     try:
-        HISTORY_FILE.write_text(json.dumps(hist, indent=2))
+        for pid, name, ts in con.execute("SELECT pid, name, ts FROM shinies ORDER BY rowid"):
+            try:
+                hist.append(shiny_entry(pid, name, datetime.fromisoformat(ts)))
+            except Exception:
+                continue
     except Exception:
         pass
+    return hist
 
 
-def load_encounter_data():
+def load_encounter_data(con):
+    """Return (total, ids, names_by_id, per-pid counts) from the encounter table."""
+    total, ids, name_map, counts = 0, set(), {}, array("I", [0]) * (MAX_ID + 1)
     try:
-        raw = json.loads(ENCOUNTER_LOG.read_text())
-        names = raw.get("names", [])
-        ids   = set(raw.get("ids", []))
-        name_map = raw.get("names_by_id", {})
-        return names, ids, name_map
+        for pid, name, n in con.execute(
+                "SELECT pid, name, COUNT(*) FROM encounters GROUP BY pid"):
+            total += n
+            counts[pid] += n
+            if pid:
+                ids.add(pid)
+                name_map[pid] = name
     except Exception:
-        return [], set(), {}
+        pass
+    return total, ids, name_map, counts
 
 
-def save_encounter_data(names, ids, name_map):
+def save_records(con, encounters=(), shinies=()):
+    """Insert (pid, name, ts) rows in a single transaction; True if committed."""
     try:
-        ENCOUNTER_LOG.write_text(json.dumps({
-            "names": names,
-            "ids": list(ids),
-            "names_by_id": name_map
-        }, indent=2))
+        con.execute("BEGIN")
+        con.executemany("INSERT INTO encounters VALUES (?, ?, ?)", encounters)
+        con.executemany("INSERT INTO shinies VALUES (?, ?, ?)", shinies)
+        con.execute("COMMIT")
+        return True
     except Exception:
-        pass
+        try:  # also lands here if the connection is already closed
+            con.execute("ROLLBACK")
+        except Exception:
+            pass
+        return False
 
 
-# ───────── Thread worker ─────────
-class WorkerSignals(QObject):
-    result = pyqtSignal(int, str, str, str, str, str, bool)
-    error  = pyqtSignal(str)
+# ───────── Background writes ─────────
+class SaveRunnable(QRunnable):
+    """Write downloaded bytes via a .part file so a crash never leaves a truncated file."""
 
-
-class PokemonWorker(QRunnable):
-    def __init__(self):
+    def __init__(self, path, data):
         super().__init__()
-        self.signals = WorkerSignals()
+        self.path, self.data = Path(path), data
 
     def run(self):
         try:
-            self.signals.result.emit(*get_pokemon())
-        except Exception as e:
-            self.signals.error.emit(str(e))
+            part = self.path.with_suffix(".part")
+            with open(part, "wb", buffering=1 << 16) as f:
+                f.write(self.data)
+            os.replace(part, self.path)
+        except Exception:
+            pass
 
 
 # ───────── Utility ─────────
+_PLACEHOLDERS = {}  # size -> QPixmap; built lazily, needs a QApplication
+
+
 def grey_placeholder(size=48):
-    pm = QPixmap(size, size)
-    pm.fill(Qt.GlobalColor.lightGray)
+    """Shared grey pixmap; callers must not paint on or mutate it."""
+    pm = _PLACEHOLDERS.get(size)
+    if pm is None:
+        pm = _PLACEHOLDERS[size] = QPixmap(size, size)
+        pm.fill(Qt.GlobalColor.lightGray)
     return pm
 
 
+def _thumb_path(sprite_path) -> Path:
+    """Pre-scaled 48px Dex thumbnail stored next to its sprite."""
+    p = Path(sprite_path)
+    return p.with_name(f"{p.stem}_thumb48.png")
+
+
+def _scale_thumb(sprite_path, full=None):
+    """Scale a sprite (or its already-decoded pixmap) to 48px, in memory."""
+    if full is None:
+        full = QPixmap(str(sprite_path))
+    if full.isNull():
+        return full
+    return full.scaled(
+        48, 48, Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation)
+
+
+def _png_bytes(pix):
+    buf = QBuffer()
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    pix.save(buf, "PNG")
+    return bytes(buf.data())
+
+
 # ───────── Main widget ─────────
 class PokedexViewer(QWidget):
     def __init__(self):
@@ -139,13 +296,32 @@ class PokedexViewer(QWidget):
         font_norm = QFont("SansSerif", 9)
 
         # Persistent data
-        self.shiny_history            = load_shiny_history()
-        (self.encounters,
+        self.db, db_warning           = open_db()
+        self.shiny_history            = load_shiny_history(self.db)
+        (self.encounter_total,
          self.encounter_ids,
-         self.id_to_name)             = load_encounter_data()
+         self.id_to_name,
+         self._enc_counts)            = load_encounter_data(self.db)
 
         self.last_shiny_time = None
 
+        # Running tallies for the stats line, bumped once per encounter
+        self._shiny_counts = collections.Counter(e["name"] for e in self.shiny_history)
+        top_pid            = max(range(1, MAX_ID + 1), key=self._enc_counts.__getitem__)
+        self._enc_top      = (top_pid, self._enc_counts[top_pid])
+        self._shiny_top    = (self._shiny_counts.most_common(1) or [(None, 0)])[0]
+
+        # Cache writes get their own single-thread pool: they never wait behind
+        # other pool users, and writes to the same path stay in order
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+
+        # Writes are debounced: apply_card only queues (pid, name, ts) rows
+        self._enc_pending   = []
+        self._shiny_pending = []
+        self.save_timer = QTimer(self, interval=5000, singleShot=True)
+        self.save_timer.timeout.connect(self.flush_saves)
+
         # ───── Encounter viewer page ─────
         viewer_page = QWidget()
         vlay = QVBoxLayout(viewer_page)
@@ -178,29 +354,31 @@ class PokedexViewer(QWidget):
         dex_outer = QVBoxLayout(dex_page)
         dex_outer.setContentsMargins(0, 0, 0, 0)
 
-        scroll = QScrollArea()
+        self.dex_scroll = scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         dex_outer.addWidget(scroll)
 
-        grid_container = QWidget()
-        self.dex_grid  = QGridLayout(grid_container)
-        self.dex_grid.setAlignment(
-            Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
-        )
-        self.dex_grid.setSpacing(6)
-        self.dex_grid.setContentsMargins(0, 0, 0, 0)
-
-        # Ensure grid width fits inside the window
-        cell_w = 60
+        # Cells are placed by hand so they can be created lazily as they
+        # scroll into view; the container is sized up-front for the scrollbar.
+        self.dex_container = grid_container = QWidget()
         cols = DEX_COLS
-        spacing = self.dex_grid.spacing()
-        grid_container.setFixedWidth(cell_w * cols + spacing * (cols - 1))
+        grid_container.setFixedWidth(DEX_CELL_W * cols + DEX_SPACING * (cols - 1))
+        # One rule for every cell (the box and its labels, as the old per-box
+        # stylesheet cascaded) instead of a parsed stylesheet per cell
+        grid_container.setStyleSheet(
+            "QWidget#dexCell, QWidget#dexCell QLabel "
+            "{ border: 1px solid lightgray; border-radius: 2px; }")
 
         scroll.setWidget(grid_container)
 
-        self.dex_cells = {}  # pid -> (pix_lbl, name_lbl, box_widget)
+        self.dex_cells = {}          # pid -> (pix_lbl, name_lbl, box_widget), sparse
+        self._dex_sprites = {}       # pid -> sprite shown this session
+        self._shiny_tips = collections.defaultdict(list)  # pid -> tooltip lines
+        for entry in self.shiny_history:
+            self._shiny_tips[entry["pid"]].append(shiny_tip_line(entry))
+        self._pix_cache  = collections.OrderedDict()      # sprite -> (full, thumb48, large140)
         self._build_dex_grid(font_norm)
 
         # ───── Stacked layout ─────
@@ -211,85 +389,190 @@ class PokedexViewer(QWidget):
         main = QVBoxLayout(self)
         main.addWidget(self.stack)
 
-        # Timers
-        self.card_timer  = QTimer(self, interval=60000)
-        self.card_timer.timeout.connect(self.fetch_card)
-        self.card_timer.start()
+        # Network: non-blocking requests, replies handled on the GUI thread
+        self.nam = QNetworkAccessManager(self)
 
-        self.since_timer = QTimer(self, interval=30000)
-        self.since_timer.timeout.connect(self.update_shiny_delay)
-        self.since_timer.start()
-
-        # Initialise tooltips from saved shiny history
-        for entry in self.shiny_history:
-            pid = int(entry["dex"][1:])  # strip '#'
-            self._append_shiny_tooltip(pid, entry)
+        # Timer: one 30 s tick refreshes the shiny delay, every other tick fetches
+        self._last_mins = -1  # minute count last shown in since_lbl
+        self._ticks_since_fetch = 0
+        self.tick_timer = QTimer(self, interval=30000)
+        self.tick_timer.timeout.connect(self._tick)
+        self.tick_timer.start()
 
         # Kick-off
         self.update_stats()
         self.update_shiny_delay()
+        if db_warning:
+            self.show_error(db_warning)
         self.fetch_card()
 
     # ───────── Build Dex Grid ─────────
     def _build_dex_grid(self, font):
-        cols = DEX_COLS
-        placeholder = grey_placeholder()
-
-        for pid in range(1, MAX_ID + 1):
-            r, c = divmod(pid - 1, cols)
-
-            pix_lbl = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
-            pix_lbl.setPixmap(placeholder)
-            name_lbl = QLabel(
-                "***",
-                alignment=Qt.AlignmentFlag.AlignCenter,
-                font=font,
-            )
-
-            box = QWidget()
-            v = QVBoxLayout(box)
-            v.setSpacing(0)
-            v.setContentsMargins(0, 0, 0, 0)
-            v.addWidget(pix_lbl)
-            v.addWidget(name_lbl)
-
-            box.setFixedSize(60, 72)
-            box.setStyleSheet("border: 1px solid lightgray; border-radius: 2px;")
-
-            # Blank tooltip; will fill when shinies logged
-            box.setToolTip("No shiny encountered yet.")
-
-            self.dex_grid.addWidget(box, r, c)
-            self.dex_cells[pid] = (pix_lbl, name_lbl, box)
-
-            # If already encountered (from saved state) update sprite/name
-            if pid in self.encounter_ids:
-                spath = CACHE_DIR / f"{pid}_normal.png"
-                if spath.exists():
-                    pix_lbl.setPixmap(QPixmap(str(spath)).scaled(
-                        48, 48, Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation))
-                if pid in self.id_to_name:
-                    name_lbl.setText(self.id_to_name[pid])
+        self._dex_font = font
+        rows = -(-MAX_ID // DEX_COLS)
+        self.dex_container.setFixedHeight(rows * (DEX_CELL_H + DEX_SPACING) - DEX_SPACING)
+
+        bar = self.dex_scroll.verticalScrollBar()
+        bar.valueChanged.connect(self._ensure_visible_cells)
+        bar.rangeChanged.connect(self._ensure_visible_cells)
+        self._ensure_visible_cells()
+
+    def _ensure_visible_cells(self, *_):
+        row_h = DEX_CELL_H + DEX_SPACING
+        first = self.dex_scroll.verticalScrollBar().value() // row_h
+        count = self.dex_scroll.viewport().height() // row_h + 2
+        self._ensure_cells(first, first + count)
+
+    def _ensure_cells(self, r_start, r_end):
+        for pid in range(r_start * DEX_COLS + 1, min(r_end * DEX_COLS, MAX_ID) + 1):
+            if pid not in self.dex_cells:
+                self._make_dex_cell(pid)
+
+    def _make_dex_cell(self, pid):
+        r, c = _GRID_POS[pid - 1]
+
+        pix_lbl = QLabel(alignment=Qt.AlignmentFlag.AlignCenter)
+        pix_lbl.setPixmap(grey_placeholder())
+        name_lbl = QLabel(
+            "***",
+            alignment=Qt.AlignmentFlag.AlignCenter,
+            font=self._dex_font,
+        )
+
+        box = QWidget(self.dex_container)
+        v = QVBoxLayout(box)
+        v.setSpacing(0)
+        v.setContentsMargins(0, 0, 0, 0)
+        v.addWidget(pix_lbl)
+        v.addWidget(name_lbl)
+
+        box.setFixedSize(DEX_CELL_W, DEX_CELL_H)
+        box.setObjectName("dexCell")
+
+        # Blank tooltip until shinies are logged
+        lines = self._shiny_tips.get(pid)
+        box.setToolTip("\n".join(lines) if lines else "No shiny encountered yet.")
+
+        box.move(c * (DEX_CELL_W + DEX_SPACING), r * (DEX_CELL_H + DEX_SPACING))
+        box.show()
+        self.dex_cells[pid] = (pix_lbl, name_lbl, box)
+
+        # If already encountered (this session or saved state) update sprite/name
+        if pid in self.encounter_ids:
+            spath = self._dex_sprites.get(pid, CACHE_DIR / f"{pid}_normal.png")
+            if str(spath) in self._pix_cache:
+                pix_lbl.setPixmap(self._get_pixes(spath)[1])
+            elif _thumb_path(spath).exists() or Path(spath).exists():
+                thumb = self._load_thumb(spath)
+                if not thumb.isNull():  # keep the placeholder otherwise
+                    pix_lbl.setPixmap(thumb)
+            if pid in self.id_to_name:
+                name_lbl.setText(self.id_to_name[pid])
 
     # ───────── Fetch & Apply Encounter ─────────
     def fetch_card(self):
-        worker = PokemonWorker()
-        worker.signals.result.connect(self.apply_card)
-        worker.signals.error.connect(self.show_error)
-        QThreadPool.globalInstance().start(worker)
+        pid   = random.randint(1, MAX_ID)
+        shiny = random.random() < SHINY_RATE
+        card  = {"pid": pid, "shiny": shiny}
+
+        # Pokemon and species are requested together; the sprite needs the
+        # pokemon data. The card is applied once all three have arrived.
+        self._get_record(f"{BASE_URL}/pokemon/{pid}", CACHE_DIR / f"pokemon_{pid}.json",
+                         pokemon_record, lambda rec: self._on_pokemon(card, rec))
+        self._get_record(f"{BASE_URL}/pokemon-species/{pid}", CACHE_DIR / f"species_{pid}.json",
+                         species_record, lambda rec: self._on_species(card, rec))
+
+    def _get(self, url, on_reply):
+        req = QNetworkRequest(QUrl(url))
+        req.setTransferTimeout(10000)
+        reply = self.nam.get(req)
+
+        def finished():
+            reply.deleteLater()
+            on_reply(reply)
+        reply.finished.connect(finished)
+
+    def _get_record(self, url, cache_path, to_record, done):
+        """Call done(record) from memory, the disk cache, or once the download finishes."""
+        key = str(cache_path)
+
+        def remember(data, raw=None):
+            # Only the small record is kept; the payload is written back to the
+            # cache if it is new or to_record added to it.
+            rec, changed = to_record(data)
+            _RECORDS[key] = rec
+            if changed or raw is not None:
+                self.save_pool.start(SaveRunnable(cache_path, json_dumps(data) if changed else raw))
+            done(rec)
+
+        try:
+            if key in _RECORDS:
+                done(_RECORDS[key])
+                return
+            if cache_path.exists():
+                remember(json_loads(cache_path.read_bytes()))
+                return
+        except Exception as e:
+            self.show_error(str(e))
+            return
+
+        def on_reply(reply):
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                self.show_error(reply.errorString())
+                return
+            raw = bytes(reply.readAll())
+            try:
+                remember(json_loads(raw), raw)
+            except Exception as e:
+                self.show_error(str(e))
+
+        self._get(url, on_reply)
+
+    def _on_pokemon(self, card, pokemon):
+        card["pokemon"] = pokemon
+        sprite_url  = pokemon["front_shiny" if card["shiny"] else "front_default"]
+        sprite_path = sprite_path_for(card["pid"], card["shiny"])
+
+        if not sprite_url or sprite_path.exists() or str(sprite_path) in self._pix_cache:
+            card["png"] = b""
+            self._maybe_apply(card)
+            return
 
-    def apply_card(self, pid, dex, name, types, flavor, sprite_path, shiny):
+        def on_reply(reply):
+            ok = reply.error() == QNetworkReply.NetworkError.NoError
+            card["png"] = bytes(reply.readAll()) if ok else b""
+            self._maybe_apply(card)
+
+        self._get(sprite_url, on_reply)
+
+    def _on_species(self, card, species):
+        card["species"] = species
+        self._maybe_apply(card)
+
+    def _maybe_apply(self, card):
+        if "png" in card and "species" in card:
+            try:
+                fields = make_card(card["pid"], card["shiny"], card["pokemon"], card["species"])
+            except Exception as e:
+                self.show_error(str(e))
+                return
+            self.apply_card(*fields, card["png"])
+
+    def apply_card(self, pid, dex, name, types, flavor, sprite_path, shiny, png):
         # Log encounter
-        self.encounters.append(name)
+        now = datetime.now(UK_TZ)
+        self.encounter_total += 1
+        self._enc_top = self._bump(self._enc_counts, self._enc_top, pid)
         self.encounter_ids.add(pid)
         self.id_to_name[pid] = name
-        save_encounter_data(self.encounters, self.encounter_ids, self.id_to_name)
+        self._enc_pending.append((pid, name, now.isoformat()))
 
         # Viewer visuals
-        pix = QPixmap(sprite_path)
+        if png:
+            self.save_pool.start(SaveRunnable(sprite_path, png))
+        pix, _, large = self._get_pixes(sprite_path, png)
         if not pix.isNull():
-            self.img_lbl.setPixmap(pix.scaledToWidth(140, Qt.TransformationMode.SmoothTransformation))
+            self.img_lbl.setPixmap(large)
         else:
             self.img_lbl.setText("(no sprite)")
 
@@ -302,80 +585,154 @@ class PokedexViewer(QWidget):
             self.dex_lbl.setStyleSheet("color: gold;")
             self.shiny_lbl.show()
 
-            now = datetime.now(UK_TZ)
-            entry = {
-                "dex":  dex,
-                "name": name,
-                "time": now.strftime("%I:%M %p").lstrip("0"),
-                "date": now.strftime("%d/%m/%Y")
-            }
+            entry = shiny_entry(pid, name, now)
             self.shiny_history.append(entry)
-            save_shiny_history(self.shiny_history)
+            self._shiny_top = self._bump(self._shiny_counts, self._shiny_top, name)
+            self._shiny_pending.append((pid, name, now.isoformat()))
             self.last_shiny_time = now
             self.update_shiny_delay()
 
             # add to tooltip
-            self._append_shiny_tooltip(pid, entry)
+            self._append_shiny_tooltip(entry)
         else:
             self.setWindowTitle("Pokédex Viewer")
             self.dex_lbl.setStyleSheet("")
             self.shiny_lbl.hide()
 
+        if not self.save_timer.isActive():
+            self.save_timer.start()
+
         # Update Dex cell visuals
         self.update_dex_cell(pid, sprite_path, name)
         self.update_stats()
 
+    def flush_saves(self):
+        if not (self._enc_pending or self._shiny_pending):
+            return
+        if save_records(self.db, self._enc_pending, self._shiny_pending):
+            self._enc_pending, self._shiny_pending = [], []
+        else:
+            # Keep the rows (e.g. database locked, disk full) and retry later
+            self.show_error("could not save encounters; will retry")
+            self.save_timer.start()
+
     # ───────── Dex helpers ─────────
     def update_dex_cell(self, pid, sprite_path, name):
+        self._dex_sprites[pid] = sprite_path
+        if pid not in self.dex_cells:
+            return  # built with the right sprite/name once scrolled into view
         pix_lbl, name_lbl, _ = self.dex_cells[pid]
-        pix_lbl.setPixmap(QPixmap(sprite_path).scaled(
-            48, 48, Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation))
+        pix_lbl.setPixmap(self._get_pixes(sprite_path)[1])
         name_lbl.setText(name)
 
-    def _append_shiny_tooltip(self, pid, entry):
+    def _get_pixes(self, sprite_path, png=b""):
+        """Decoded and pre-scaled pixmaps for a sprite, kept in a small LRU.
+
+        ``png`` holds the raw bytes of a sprite that may not be on disk yet.
+        """
+        key = str(sprite_path)
+        pixes = self._pix_cache.get(key)
+        if pixes is not None:
+            self._pix_cache.move_to_end(key)
+            return pixes
+
+        if png:
+            full = QPixmap()
+            full.loadFromData(png)
+        else:
+            full = QPixmap(key)
+        if full.isNull():
+            return full, full, full  # not cached; the sprite may turn up later
+        thumb = self._load_thumb(key, full)
+        large = full.scaledToWidth(140, Qt.TransformationMode.SmoothTransformation)
+
+        pixes = self._pix_cache[key] = (full, thumb, large)
+        if len(self._pix_cache) > 128:
+            self._pix_cache.popitem(last=False)
+        return pixes
+
+    def _load_thumb(self, sprite_path, full=None):
+        """Cached 48px thumbnail, re-scaled from the sprite if missing or unreadable.
+
+        A re-scaled thumbnail is written to disk on the save pool.
+        """
+        tpath = _thumb_path(sprite_path)
+        if tpath.exists():
+            pix = QPixmap(str(tpath))
+            if not pix.isNull():
+                return pix
+        pix = _scale_thumb(sprite_path, full)
+        if not pix.isNull():
+            self.save_pool.start(SaveRunnable(tpath, _png_bytes(pix)))
+        return pix
+
+    def _append_shiny_tooltip(self, entry):
+        pid   = entry["pid"]
+        lines = self._shiny_tips[pid]
+        lines.append(shiny_tip_line(entry))
         _, _, box = self.dex_cells.get(pid, (None, None, None))
-        if not box:
-            return
-        existing = box.toolTip().splitlines() if box.toolTip() else []
-        if existing and existing[0].startswith("No shiny"):
-            existing = []
-        new_line = f"{entry['time']} – {entry['date']}"
-        existing.append(new_line)
-        box.setToolTip("\n".join(existing))
+        if box:
+            box.setToolTip("\n".join(lines))
 
     # ───────── Stats & Timers ─────────
+    def _tick(self):
+        self._ticks_since_fetch += 1
+        if self._ticks_since_fetch >= 2:
+            self._ticks_since_fetch = 0
+            self.fetch_card()
+        self.update_shiny_delay()
+
     def update_shiny_delay(self):
-        if not self.last_shiny_time:
+        mins = (None if not self.last_shiny_time else
+                int((datetime.now(UK_TZ) - self.last_shiny_time).total_seconds() // 60))
+        if mins == self._last_mins:
+            return  # text unchanged; skip the relabel/repaint
+        self._last_mins = mins
+        if mins is None:
             self.since_lbl.setText("⏱️ No shiny encountered yet.")
             return
-        mins = int((datetime.now(UK_TZ) - self.last_shiny_time).total_seconds() // 60)
         self.since_lbl.setText(
             "✨ Just now!" if mins == 0 else
             "⏱️ 1 minute since last shiny!" if mins == 1 else
             f"⏱️ {mins} minutes since last shiny!"
         )
 
+    @staticmethod
+    def _bump(counts, top, key):
+        counts[key] += 1
+        return (key, counts[key]) if counts[key] > top[1] else top
+
     def update_stats(self):
-        total = len(self.encounters)
-        counts = collections.Counter(self.encounters)
-        most   = counts.most_common(1)
-        shiny_counts = collections.Counter(e["name"] for e in self.shiny_history)
-        shiny_top    = shiny_counts.most_common(1)
+        total = self.encounter_total
+        most_pid, most_n    = self._enc_top
+        most_name           = self.id_to_name.get(most_pid)
+        shiny_name, shiny_n = self._shiny_top
 
         parts = [f"🎯 Encounters: {total}"]
-        if most and most[0][1] > 1:
-            parts.append(f" 🔁 Most encountered: {most[0][0]} ({most[0][1]})")
-        if shiny_top:
-            parts.append(f" ✨ Top shiny: {shiny_top[0][0]} ({shiny_top[0][1]})")
+        if most_n > 1:
+            parts.append(f" 🔁 Most encountered: {most_name} ({most_n})")
+        if shiny_n:
+            parts.append(f" ✨ Top shiny: {shiny_name} ({shiny_n})")
         self.stats_lbl.setText("  |".join(parts))
 
     # ───────── Error ─────────
     def show_error(self, msg): self.flavor_lbl.setText(f"Error: {msg}")
 
+    def closeEvent(self, e):
+        # The Tool window doesn't quit the app on close, so stop the timers
+        # and quit explicitly before the database goes away.
+        self.tick_timer.stop()
+        self.save_timer.stop()
+        self.flush_saves()
+        self.db.close()
+        self.save_pool.waitForDone()
+        super().closeEvent(e)
+        QApplication.quit()
+
     # ───────── Dex Toggle & Context Menu ─────────
     def toggle_dex_view(self):
         self.stack.setCurrentIndex(1 - self.stack.currentIndex())
+        self._ensure_visible_cells()
 
     def contextMenuEvent(self, e):
         m = QMenu(self)